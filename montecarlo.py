@@ -1,6 +1,32 @@
+import numbers
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import pandas as pd
 import numpy as np
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+_rng = np.random.default_rng()
+
+# Below this many rolls the numpy analysis is faster than dispatching to numba.
+_NUMBA_MIN_ROLLS = 100_000
+
+
+def set_seed(seed=None):
+    """
+    Reseed the random number generator shared by all dice and games.
+
+    Parameters
+    ----------
+    seed : int or None, optional
+        Seed for numpy's default Generator; None draws fresh entropy.
+    """
+    global _rng
+    _rng = np.random.default_rng(seed)
+
 
 class Die:
     """
@@ -8,8 +34,18 @@ class Die:
 
     Attributes:
     -----------
-    die : pandas.DataFrame
-        A dataframe holding the faces and weights of the die.
+    _faces : numpy.ndarray
+        The face values of the die.
+    _weights : numpy.ndarray
+        The weight of each face, aligned with _faces.
+    _index : dict
+        Maps each face to its position in _faces.
+    _uniform : bool
+        True while every face still has its default weight.
+    _cdf : numpy.ndarray
+        Cached cumulative distribution of the normalized weights.
+    _cdf_stale : bool
+        True when the weights changed since _cdf was last computed.
     """
 
     def __init__(self, faces):
@@ -31,7 +67,16 @@ class Die:
         """
         if not isinstance(faces, (list, np.ndarray)):
             raise TypeError("Faces must be a list or numpy array.")
-        self.die = pd.DataFrame({'face': faces, 'weight': 1.0})
+        self._faces = np.asarray(faces)
+        if self._faces.dtype.kind in 'US' and not all(isinstance(face, (str, bytes)) for face in faces):
+            self._faces = np.asarray(faces, dtype=object)
+        self._weights = np.ones(len(self._faces), dtype=np.float64)
+        self._index = {face: i for i, face in enumerate(self._faces)}
+        if len(self._index) != len(self._faces):
+            raise ValueError("Face values must be unique.")
+        self._uniform = True
+        self._cdf = None
+        self._cdf_stale = True
 
     def change_weight(self, face, new_weight):
         """
@@ -47,13 +92,20 @@ class Die:
         Raises
         ------
         ValueError
-            If the face does not exist in the die.
+            If the face does not exist in the die or new_weight is negative.
         TypeError
             If new_weight is not numeric.
         """
-        if face not in self.die['face'].values:
+        idx = self._index.get(face)
+        if idx is None:
             raise ValueError(f"Face {face} does not exist.")
-        self.die.loc[self.die['face'] == face, 'weight'] = new_weight
+        if not isinstance(new_weight, numbers.Real):
+            raise TypeError("Weight must be numeric.")
+        if not new_weight >= 0:
+            raise ValueError("Weight must be non-negative.")
+        self._weights[idx] = new_weight
+        self._uniform = False
+        self._cdf_stale = True
 
     def show_state(self):
         """
@@ -64,7 +116,7 @@ class Die:
         pandas.DataFrame
             A DataFrame showing the current faces and corresponding weights.
         """
-        return self.die
+        return pd.DataFrame({'face': self._faces, 'weight': self._weights})
 
     def roll(self, num_rolls=1):
         """
@@ -80,12 +132,54 @@ class Die:
         numpy.ndarray
             An array of face values resulting from the rolls.
         """
-        outcomes = np.random.choice(
-            self.die['face'],
-            size=num_rolls,
-            p=self.die['weight'] / self.die['weight'].sum()
-        )
-        return outcomes
+        return self._faces[self._sample(num_rolls, _rng)]
+
+    def _sample(self, size, rng):
+        """
+        Draw face indices according to the current weights.
+
+        Parameters
+        ----------
+        size : int or tuple of int
+            Shape of the array of indices to draw.
+        rng : numpy.random.Generator
+            The generator to draw from.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of positions into _faces with the requested shape.
+        """
+        if self._uniform:
+            return rng.integers(0, len(self._faces), size=size)
+        return self._invert(rng.random(size))
+
+    def _invert(self, u):
+        """
+        Map uniform draws in [0, 1) to face indices through the weight CDF.
+
+        Parameters
+        ----------
+        u : numpy.ndarray
+            Uniform random draws.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of positions into _faces with the same shape as u.
+
+        Raises
+        ------
+        ValueError
+            If the weights do not sum to a positive number.
+        """
+        if self._cdf_stale:
+            cdf = np.cumsum(self._weights)
+            if not cdf[-1] > 0:
+                raise ValueError("At least one face must have a positive weight.")
+            self._cdf = cdf / cdf[-1]
+            self._cdf_stale = False
+        return np.searchsorted(self._cdf, u, side='right')
 
 
 class Game:
@@ -97,7 +191,19 @@ class Game:
     dice : list of Die
         A list containing Die objects used in the game.
     results : pandas.DataFrame or None
-        DataFrame storing results from the most recent play. Initialized as None.
+        DataFrame storing results from the most recent play. Initialized as None
+        and decoded from _results_codes on first request.
+    _results_codes : numpy.ndarray or None
+        The (num_rolls, n_dice) int32 array of face codes from the most recent play.
+    _homogeneous : bool
+        True when every die has the same faces, so all dice can be sampled at once.
+    _dtype : numpy.dtype
+        Common dtype of the dice faces. Dice of the same kind (signed int,
+        unsigned int or float) share a promoted dtype; any other mix is object.
+    _faces : numpy.ndarray
+        Sorted distinct faces across all dice; face codes index into it.
+    _face_codes : list of numpy.ndarray
+        For each die, the code of each of its faces, in the die's face order.
     """
 
     def __init__(self, dice):
@@ -121,8 +227,27 @@ class Game:
                 raise TypeError("All elements in the list must be Die objects.")
         self.dice = dice
         self._results = None
-
-    def play(self, num_rolls):
+        self._results_codes = None
+        self._homogeneous = len(dice) > 0 and all(
+            die._faces.dtype == dice[0]._faces.dtype
+            and np.array_equal(die._faces, dice[0]._faces)
+            for die in dice[1:]
+        )
+        dtypes = {die._faces.dtype for die in dice}
+        kinds = {dtype.kind for dtype in dtypes}
+        if len(dtypes) == 1:
+            self._dtype = dtypes.pop()
+        elif len(kinds) == 1 and kinds <= set('iuf'):
+            self._dtype = np.result_type(*dtypes)
+        else:
+            self._dtype = np.dtype(object)
+        labels = [die._faces.astype(self._dtype) for die in dice]
+        codes, faces = _factorize_faces(np.concatenate(labels) if labels else np.empty(0))
+        self._faces = np.asarray(faces, dtype=self._dtype)
+        splits = np.cumsum([len(die._faces) for die in dice])[:-1]
+        self._face_codes = np.split(codes.astype(np.int32), splits)
+
+    def play(self, num_rolls, workers=None):
         """
         Play the game by rolling all dice a specified number of times.
 
@@ -130,17 +255,57 @@ class Game:
         ----------
         num_rolls : int
             The number of times to roll the dice.
+        workers : int or None, optional
+            Number of processes to split the rolls across. None or 1 (default)
+            rolls in the current process. Scripts using more than one worker
+            must call play() under an ``if __name__ == '__main__':`` guard.
 
         Returns
         -------
         None
-            Results are stored in the 'results' attribute as a DataFrame.
+            Results are stored as an array of face codes; the DataFrame is
+            decoded on demand.
+        """
+        if workers is None or workers <= 1:
+            codes = _roll_codes(self.dice, self._face_codes, self._homogeneous, num_rolls, _rng)
+        else:
+            codes = self._play_parallel(num_rolls, workers)
+        self._results_codes = codes
+        self._results = None
+
+    def _play_parallel(self, num_rolls, workers):
         """
-        outcomes = {}
-        for i, die in enumerate(self.dice):
-            outcomes[i] = die.roll(num_rolls)
-        self._results = pd.DataFrame(outcomes)
-        self._results.index.name = 'roll_number'
+        Roll the dice in chunks across a pool of worker processes.
+
+        Each chunk gets its own child seed, so results are reproducible under
+        set_seed() regardless of the order in which workers finish.
+
+        Parameters
+        ----------
+        num_rolls : int
+            The total number of times to roll the dice.
+        workers : int
+            The number of worker processes.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (num_rolls, n_dice) array of face codes.
+        """
+        bounds = np.linspace(0, num_rolls, workers + 1).astype(int)
+        seeds = np.random.SeedSequence(int(_rng.integers(2**63))).spawn(workers)
+        game = (self.dice, self._face_codes, self._homogeneous)
+        codes = np.empty((num_rolls, len(self.dice)), dtype=np.int32)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_roll_chunk, *game, stop - start, seed): start
+                for start, stop, seed in zip(bounds[:-1], bounds[1:], seeds)
+            }
+            for future in as_completed(futures):
+                chunk = future.result()
+                start = futures[future]
+                codes[start:start + len(chunk)] = chunk
+        return codes
 
     def show_results(self, form='wide'):
         """
@@ -155,22 +320,26 @@ class Game:
         Returns
         -------
         pandas.DataFrame
-            A DataFrame of the play results in the specified format.
+            A DataFrame of the play results in the specified format. The wide
+            form shares its data with the game; treat it as read-only.
 
         Raises
         ------
         ValueError
             If form is not 'wide' or 'narrow'.
         """
-        if self._results is None:
+        if self._results_codes is None:
             raise ValueError("No results available. Please play the game first.")
+        if self._results is None:
+            self._results = _results_frame(self._faces[self._results_codes])
         if form == 'wide':
-            return self._results.copy()
+            return self._results.copy(deep=False)
         elif form == 'narrow':
             return self._results.melt(var_name='die_number', value_name='face_rolled', ignore_index=False)
         else:
             raise ValueError("Invalid form option. Use 'wide' or 'narrow'.")
 
+
 class Analyzer:
     """
     A class to analyze results of a Game instance.
@@ -181,6 +350,16 @@ class Analyzer:
         The Game object containing dice and results.
     results : pandas.DataFrame
         DataFrame storing the results of the game (faces rolled per die per roll).
+        Decoded from _codes on first access.
+    _codes : numpy.ndarray
+        The game's (num_rolls, n_dice) int32 face codes, which the analyses read directly.
+    _faces : numpy.ndarray
+        The game's sorted faces that the codes index into.
+    _analysis : tuple or None
+        Cached (faces, jackpots, face counts, sorted codes) from a single
+        pass over the face codes, computed on first use.
+    _face_counts : pandas.DataFrame or None
+        The face counts wrapped as a DataFrame, built on first use.
     """
 
     def __init__(self, game):
@@ -196,11 +375,33 @@ class Analyzer:
         ------
         TypeError
             If the provided object is not an instance of Game.
+        ValueError
+            If the game has not been played yet.
         """
         if not isinstance(game, Game):
             raise TypeError("Input must be an instance of the Game class.")
+        if game._results_codes is None:
+            raise ValueError("No results available. Please play the game first.")
         self.game = game
-        self.results = game.show_results()
+        self._codes = game._results_codes
+        self._faces = game._faces
+        self._results = None
+        self._analysis = None
+        self._face_counts = None
+
+    @property
+    def results(self):
+        """
+        The analyzed results as a DataFrame, built on first access.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The faces rolled per die per roll.
+        """
+        if self._results is None:
+            self._results = _results_frame(self._faces[self._codes])
+        return self._results
 
     def jackpot(self):
         """
@@ -211,7 +412,11 @@ class Analyzer:
         int
             The count of jackpots found in the game results.
         """
-        return self.results[self.results.nunique(axis=1) == 1].shape[0]
+        n_rolls, n_dice = self._codes.shape
+        if n_dice == 1:
+            return n_rolls
+        _, jackpots, _, _ = self._analyze()
+        return int(jackpots)
     
     def face_counts_per_roll(self):
         """
@@ -223,7 +428,11 @@ class Analyzer:
             A DataFrame where each row corresponds to a roll and each column is a face.
             The cell values indicate how many times that face appeared in the roll.
         """
-        return self.results.apply(lambda row: row.value_counts(), axis=1).fillna(0).astype(int)
+        if self._face_counts is None:
+            faces, _, counts, _ = self._analyze()
+            index = pd.RangeIndex(len(counts), name='roll_number')
+            self._face_counts = pd.DataFrame(counts, index=index, columns=faces, copy=False)
+        return self._face_counts.copy()
 
     def combo(self):
         """
@@ -235,8 +444,33 @@ class Analyzer:
             DataFrame with columns 'combination' (a sorted tuple of faces) and 'count'.
             Each row represents a unique combination of faces and how often it occurred.
         """
-        combos = self.results.apply(lambda row: tuple(sorted(row)), axis=1)
-        return combos.value_counts().reset_index(name='count').rename(columns={'index': 'combination'})
+        faces, _, _, codes = self._analyze()
+        rows = pd.DataFrame(codes)
+        sizes = rows.groupby(list(rows.columns)).size().sort_values(ascending=False, kind='stable')
+        keys = sizes.index.to_frame(index=False).to_numpy()
+        combos = list(map(tuple, np.asarray(faces).astype(object)[keys]))
+        return pd.DataFrame({'combination': combos, 'count': sizes.to_numpy()})
+
+    def _analyze(self):
+        """
+        Compute jackpots, per-roll face counts and row-sorted face codes in one pass.
+
+        Uses the numba kernel when numba is installed and there are at least
+        _NUMBA_MIN_ROLLS rolls, and numpy otherwise.
+
+        Returns
+        -------
+        tuple
+            The sorted faces, the jackpot count, a (n_rolls, n_faces) array of
+            face counts and a (n_rolls, n_dice) array of row-sorted face codes.
+        """
+        if self._analysis is None:
+            if numba is None or len(self._codes) < _NUMBA_MIN_ROLLS:
+                analyze = _analyze_numpy
+            else:
+                analyze = _analyze_numba
+            self._analysis = (self._faces,) + analyze(self._codes, len(self._faces))
+        return self._analysis
 
     def permutation_count(self):
         """
@@ -248,4 +482,164 @@ class Analyzer:
             DataFrame where each row represents a roll and each column is a face value.
             The cell values show how many times the face appeared in that roll.
         """
-        return self.results.apply(lambda row: row.value_counts(), axis=1).fillna(0).astype(int)
+        return self.face_counts_per_roll()
+
+
+def _factorize_faces(labels):
+    """
+    Encode face labels as integer codes into a sorted array of distinct faces.
+
+    Object labels are keyed by type as well as value, so that faces such as
+    2 and 2.0 or 1 and True from different dice stay distinct.
+
+    Parameters
+    ----------
+    labels : numpy.ndarray
+        The faces of every die in the game, concatenated.
+
+    Returns
+    -------
+    tuple
+        The codes, aligned with labels, and the distinct faces they index into.
+    """
+    if labels.dtype != object:
+        return pd.factorize(labels, sort=True, use_na_sentinel=False)
+    keys = np.empty(len(labels), dtype=object)
+    keys[:] = [(type(face), face if face == face else None) for face in labels]
+    codes, uniques = pd.factorize(keys, use_na_sentinel=False)
+    _, first = np.unique(codes, return_index=True)
+    faces = labels[first]
+    order = sorted(
+        range(len(faces)),
+        key=lambda i: (type(faces[i]).__name__, faces[i] != faces[i], uniques[i][1]),
+    )
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order))
+    return rank[codes], faces[order]
+
+
+def _results_frame(arr):
+    """
+    Wrap a (num_rolls, n_dice) results array in a DataFrame.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        Faces rolled, one row per roll and one column per die.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The results indexed by roll number.
+    """
+    results = pd.DataFrame(arr)
+    results.index.name = 'roll_number'
+    return results
+
+
+def _roll_codes(dice, face_codes, homogeneous, num_rolls, rng):
+    """
+    Roll every die num_rolls times and return the results as face codes.
+
+    Parameters
+    ----------
+    dice : list of Die
+        The dice to roll.
+    face_codes : list of numpy.ndarray
+        For each die, the game-wide code of each of its faces.
+    homogeneous : bool
+        Whether all dice share the same faces.
+    num_rolls : int
+        The number of times to roll the dice.
+    rng : numpy.random.Generator
+        The generator to draw from.
+
+    Returns
+    -------
+    numpy.ndarray
+        A (num_rolls, n_dice) int32 array of face codes.
+    """
+    n_dice = len(dice)
+    first = dice[0] if n_dice else None
+    if homogeneous and all(
+        die is first or np.array_equal(die._weights, first._weights)
+        for die in dice[1:]
+    ):
+        return face_codes[0][first._sample((num_rolls, n_dice), rng)]
+    u = rng.random((num_rolls, n_dice))
+    codes = np.empty((num_rolls, n_dice), dtype=np.int32)
+    for i, die in enumerate(dice):
+        codes[:, i] = face_codes[i][die._invert(u[:, i])]
+    return codes
+
+
+def _roll_chunk(dice, face_codes, homogeneous, num_rolls, seed):
+    """
+    Worker entry point for Game._play_parallel.
+
+    Parameters
+    ----------
+    seed : numpy.random.SeedSequence
+        Seed for this chunk's generator. The other parameters are as for
+        _roll_codes.
+
+    Returns
+    -------
+    numpy.ndarray
+        A (num_rolls, n_dice) int32 array of face codes.
+    """
+    return _roll_codes(dice, face_codes, homogeneous, num_rolls, np.random.default_rng(seed))
+
+
+def _analyze_numpy(codes, n_faces):
+    """
+    Vectorized numpy implementation of Analyzer._analyze.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        A (n_rolls, n_dice) array of integer face codes.
+    n_faces : int
+        The number of distinct face codes.
+
+    Returns
+    -------
+    tuple
+        The jackpot count, the per-roll face counts and the row-sorted codes.
+    """
+    n_rolls = codes.shape[0]
+    jackpots = np.count_nonzero((codes == codes[:, :1]).all(axis=1))
+    bins = (np.arange(n_rolls)[:, None] * n_faces + codes).ravel()
+    counts = np.bincount(bins, minlength=n_rolls * n_faces).reshape(n_rolls, n_faces)
+    return jackpots, counts, np.sort(codes, axis=1)
+
+
+if numba is None:
+    _analyze_numba = None
+else:
+    @numba.njit(parallel=True, cache=True)
+    def _analyze_numba(codes, n_faces):
+        """
+        Numba implementation of Analyzer._analyze, parallel across rolls.
+
+        Each roll is counted and insertion-sorted in place, which is cheap
+        because a game only has a handful of dice.
+        """
+        n_rolls, n_dice = codes.shape
+        counts = np.zeros((n_rolls, n_faces), dtype=np.int64)
+        sorted_codes = codes.copy()
+        jackpots = 0
+        for i in numba.prange(n_rolls):
+            row = sorted_codes[i]
+            for j in range(n_dice):
+                counts[i, row[j]] += 1
+            for j in range(1, n_dice):
+                key = row[j]
+                k = j - 1
+                while k >= 0 and row[k] > key:
+                    row[k + 1] = row[k]
+                    k -= 1
+                row[k + 1] = key
+            if n_dice > 0 and row[0] == row[n_dice - 1]:
+                jackpots += 1
+        return jackpots, counts, sorted_codes
@@ -1,13 +1,9 @@
 import unittest
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from montecarlo import Die, Game, Analyzer
+import montecarlo
+from montecarlo import Die, Game, Analyzer, set_seed
 import itertools
-help(Die)
-help(Game)
-help(Analyzer)
-
 
 
 class TestDie(unittest.TestCase):
@@ -17,6 +13,33 @@ class TestDie(unittest.TestCase):
         print(die.show_state()) 
         self.assertEqual(die.show_state().loc[0, 'weight'], 5)
 
+    def test_mixed_faces(self):
+        die = Die(['a', 1])
+        die.change_weight(1, 5)
+        self.assertEqual(die.show_state().loc[1, 'weight'], 5)
+        self.assertTrue(all(face in ('a', 1) for face in die.roll(10)))
+
+    def test_duplicate_faces(self):
+        with self.assertRaises(ValueError):
+            Die([1, 2, 2])
+
+    def test_negative_weight(self):
+        die = Die([1, 2, 3])
+        with self.assertRaises(ValueError):
+            die.change_weight(1, -5)
+
+    def test_non_numeric_weight(self):
+        die = Die([1, 2, 3])
+        with self.assertRaises(TypeError):
+            die.change_weight(1, '5')
+
+    def test_all_zero_weights(self):
+        die = Die([1, 2])
+        die.change_weight(1, 0)
+        die.change_weight(2, 0)
+        with self.assertRaises(ValueError):
+            die.roll(10)
+
 class TestGame(unittest.TestCase):
     def test_play(self):
         die1 = Die([1, 2, 3])
@@ -25,6 +48,54 @@ class TestGame(unittest.TestCase):
         game.play(10)
         self.assertEqual(len(game.show_results()), 10)
 
+    def test_set_seed(self):
+        game = Game([Die([1, 2, 3]), Die([1, 2, 3])])
+        set_seed(42)
+        game.play(10)
+        first = game.show_results()
+        set_seed(42)
+        game.play(10)
+        self.assertTrue(first.equals(game.show_results()))
+
+    def test_bool_and_int_dice(self):
+        game = Game([Die([True, False]), Die([5, 6])])
+        game.play(10)
+        results = game.show_results()
+        self.assertTrue(results[0].isin([True, False]).all())
+        self.assertTrue(all(isinstance(face, (bool, np.bool_)) for face in results[0]))
+
+    def test_int_and_float_dice(self):
+        big = 2**60 + 1
+        game = Game([Die([big, 3]), Die([1.5, 2.0])])
+        game.play(200)
+        results = game.show_results()
+        self.assertTrue(results[0].isin([big, 3]).all())
+        self.assertTrue(all(type(face) is int for face in results[0]))
+        self.assertIn(big, set(results[0]))
+        self.assertTrue(all(type(face) is float for face in results[1]))
+        game = Game([Die([1, 2]), Die([1.5, 2.0])])
+        game.play(200)
+        combos = Analyzer(game).combo()
+        for combination in combos['combination']:
+            self.assertEqual([type(face) for face in combination], [float, int])
+
+    def test_nan_face(self):
+        set_seed(0)
+        game = Game([Die([1.0, 2.0, np.nan])])
+        game.play(300)
+        self.assertTrue(game.show_results()[0].isna().any())
+        counts = Analyzer(game).face_counts_per_roll()
+        self.assertTrue((counts.sum(axis=1) == 1).all())
+
+    def test_play_workers(self):
+        die = Die([1, 2, 3])
+        die.change_weight(3, 4)
+        game = Game([die, die, Die([1, 2])])
+        game.play(100, workers=2)
+        results = game.show_results()
+        self.assertEqual(results.shape, (100, 3))
+        self.assertTrue(results[2].isin([1, 2]).all())
+
 class TesttAnalyzer(unittest.TestCase):
     def test_jackpot(self):
         die = Die([1, 2, 3])
@@ -35,5 +106,49 @@ class TesttAnalyzer(unittest.TestCase):
         print(game.show_results()) 
         self.assertIsInstance(jackpot_count, int)
 
+    def test_jackpot_multiple_dice(self):
+        set_seed(3)
+        die = Die([1, 2])
+        game = Game([die, die, die])
+        game.play(100)
+        results = game.show_results()
+        expected = int((results.nunique(axis=1) == 1).sum())
+        self.assertEqual(Analyzer(game).jackpot(), expected)
+        self.assertGreater(expected, 0)
+
+    def test_face_counts_per_roll(self):
+        die = Die(['a', 'b', 'c'])
+        game = Game([die, die, die])
+        game.play(20)
+        analyzer = Analyzer(game)
+        counts = analyzer.face_counts_per_roll()
+        self.assertEqual(counts.shape[0], 20)
+        self.assertTrue((counts.sum(axis=1) == 3).all())
+        counts.iloc[0, 0] = 9
+        self.assertTrue((analyzer.face_counts_per_roll().sum(axis=1) == 3).all())
+
+    def test_combo(self):
+        set_seed(7)
+        die = Die(['c', 'a', 'b'])
+        game = Game([die, die, die])
+        game.play(200)
+        combos = Analyzer(game).combo()
+        for combination in combos['combination']:
+            self.assertEqual(combination, tuple(sorted(combination)))
+            self.assertTrue(set(combination) <= {'a', 'b', 'c'})
+        self.assertEqual(combos['count'].sum(), 200)
+        expected = game.show_results().apply(lambda row: tuple(sorted(row)), axis=1).value_counts()
+        self.assertEqual(dict(zip(combos['combination'], combos['count'])), expected.to_dict())
+
+    @unittest.skipIf(montecarlo.numba is None, "numba is not installed")
+    def test_numba_matches_numpy(self):
+        codes = np.random.default_rng(0).integers(0, 4, size=(500, 3)).astype(np.int32)
+        expected = montecarlo._analyze_numpy(codes, 4)
+        actual = montecarlo._analyze_numba(codes, 4)
+        self.assertEqual(actual[0], expected[0])
+        self.assertTrue((actual[1] == expected[1]).all())
+        self.assertTrue((actual[2] == expected[2]).all())
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -8,7 +8,7 @@ setup(
     author_email='xbw8de@virginia.edu',
     description='This simulator rolls customizable letter dice, stores the outcomes, and analyzes permutations to identify valid words',
     packages=find_packages(),    
-    install_requires=['numpy >= 1.11.1', 'matplotlib >= 1.5.1'],
+    install_requires=['numpy >= 1.17', 'pandas >= 1.5', 'matplotlib >= 1.5.1'],
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',